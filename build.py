@@ -16,16 +16,21 @@ Example:
 
 from __future__ import annotations
 import shutil
-import argcomplete
 import argparse
+import functools
+import hashlib
 import os
+import pickle
+import struct
 import subprocess
 import sys
-from multiprocessing import cpu_count
+from collections import defaultdict
 from pathlib import Path
 from typing import List
-# External package, json is too verbose
-import yaml
+
+# Pickled caches (parsed config files, the argument parser), each behind a validation header
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "build_py"
+_CACHE_HEADER = struct.Struct("<qq")
 
 FRONTENDS = ["onnx", "paddle", "tf", "tf_lite", "pytorch", "ir", "jax"]
 PLUGINS = [
@@ -33,6 +38,34 @@ PLUGINS = [
     "hetero", "multi", "auto", "template", "auto_batch", "proxy",
 ]
 
+BUILD_TYPES = ["Release", "Debug", "RelWithDebInfo"]
+
+# CMake --log-level per verbosity (-q → 0, default 1, -v → 2, ...); DEBUG above
+CMAKE_LOG_LEVELS = {0: "ERROR", 1: "WARNING", 2: "NOTICE", 3: "STATUS"}
+
+# Written to the build dir after a successful configure, see _configure_digest
+CONFIGURE_STAMP = ".buildpy_args.sha"
+CONFIGURE_ENV_VARS = ("CC", "CXX", "CFLAGS", "CXXFLAGS", "LDFLAGS")
+
+# --use-presets: configure preset written to the source tree, see _write_preset
+PRESETS_FILE = "CMakeUserPresets.json"
+PRESET_NAME = "buildpy"
+PRESETS_VERSION = 3
+# -c with --use-presets: configure+build in one 'cmake --workflow' run (CMake 3.25+)
+WORKFLOW_PRESET_NAME = "buildpy-full"
+WORKFLOW_PRESETS_VERSION = 6
+
+# --cmake-init-cache: initial-cache script written to the build dir, see _write_init_cache
+INIT_CACHE_FILE = "buildpy_init.cmake"
+
+# Toolchain files per --arch, relative to the repository root
+TOOLCHAINS = {
+    "x86": "cmake/toolchains/x86_64.linux.toolchain.cmake",
+    "arm": "cmake/arm64.toolchain.cmake",
+    "arm32": "cmake/arm.toolchain.cmake",
+    "riscv": "cmake/toolchains/riscv64-100-xuantie-gnu.toolchain.cmake",
+}
+
 # Flags that should accept ON/OFF instead of boolean
 ON_OFF_FLAGS = [
     # Debug
@@ -64,8 +97,41 @@ ON_OFF_FLAGS = [
     "cpu_specific_target_per_test"
 ] + PLUGINS + [f"ov_{fe}_frontend" for fe in FRONTENDS]
 
+# (flag, argparse dest, CMake variable) for every ON/OFF toggle
+_ENABLE_SPECS = [(flag, f"enable_{flag}", f"ENABLE_{flag.upper()}") for flag in ON_OFF_FLAGS]
+# (option string, help) for every ON/OFF toggle, sharing one choices tuple
+_ON_OFF_ARGS = [(f"--enable-{flag.replace('_', '-')}", f"{key} (ON / OFF)") for flag, _, key in _ENABLE_SPECS]
+_ON_OFF_CHOICES = ("on", "off")
+# CMake variables switched ON by --frontends / --plugins
+_FRONTEND_KEYS = {fe: f"ENABLE_OV_{fe.upper()}_FRONTEND" for fe in FRONTENDS}
+_PLUGIN_KEYS = {pl: f"ENABLE_{pl.upper()}" for pl in PLUGINS}
+
+
+_REPO_ROOT: Path | None = None
+
 
 def find_repo_root() -> Path:
+    """Locate the repository root, walking up from cwd to the nearest .git entry.
+
+    Falls back to git itself when no .git entry is found (e.g. GIT_DIR is set).
+    The result is cached for the lifetime of the process.
+    """
+    global _REPO_ROOT
+    if _REPO_ROOT is not None:
+        return _REPO_ROOT
+
+    cwd = Path.cwd().resolve()
+    for d in (cwd, *cwd.parents):
+        # .git is a directory for regular checkouts and a file for worktrees/submodules
+        if (d / ".git").exists():
+            _REPO_ROOT = d
+            return d
+
+    _REPO_ROOT = _git_repo_root()
+    return _REPO_ROOT
+
+
+def _git_repo_root() -> Path:
     """Locate the repository root using git."""
     try:
         result = subprocess.run(
@@ -87,9 +153,120 @@ def find_repo_root() -> Path:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> str | None:
+    """Cached shutil.which, PATH is scanned at most once per tool."""
+    return shutil.which(name)
+
+
+def _ninja_supports_multi_config() -> bool:
+    """Check that ninja is in PATH and new enough (1.10) for 'Ninja Multi-Config'."""
+    ninja = _which('ninja')
+    if not ninja:
+        return False
+    try:
+        result = subprocess.run([ninja, '--version'], capture_output=True, text=True, check=True)
+        version = tuple(int(part) for part in result.stdout.strip().split('.')[:2])
+    except (subprocess.CalledProcessError, ValueError, OSError):
+        return False
+    return version >= (1, 10)
+
+
+def _compiler_launcher() -> str | None:
+    """Return the compiler cache to use: ccache, else sccache, else none."""
+    for tool in ("ccache", "sccache"):
+        if _which(tool):
+            return tool
+    print("Warning: neither ccache nor sccache found in PATH; building without a compiler cache",
+          file=sys.stderr)
+    return None
+
+
+def _fast_linker() -> str | None:
+    """Return the linker to pass via -fuse-ld: mold, else lld, else none."""
+    for linker, exe in (("mold", "mold"), ("lld", "ld.lld")):
+        if _which(exe):
+            return linker
+    print("Warning: neither mold nor lld found in PATH; using the default linker", file=sys.stderr)
+    return None
+
+
 def _nprocs_minus_two() -> int:
-    """Return at least 1 and at most (nproc–2)."""
-    return max(1, cpu_count() - 2)
+    """Return at least 1 and at most (nproc–2).
+
+    Uses the CPUs this process may run on (cgroups, taskset), falling back to
+    the host CPU count where sched_getaffinity is unavailable.
+    """
+    try:
+        n = len(os.sched_getaffinity(0))
+    except AttributeError:
+        n = os.cpu_count() or 1
+    return max(1, n - 2)
+
+
+_CACHE_MISS = object()
+
+
+def _read_cache(cache_path: Path, header: bytes, unpickler=pickle.Unpickler):
+    """Return the object pickled at cache_path if its header matches, else _CACHE_MISS."""
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(header)) == header:
+                return unpickler(f).load()
+    except Exception:
+        pass
+    return _CACHE_MISS
+
+
+def _write_cache(cache_path: Path, header: bytes, obj, pickler=pickle.Pickler) -> None:
+    """Pickle obj to cache_path behind header. Best effort: atomic, failures ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            pickler(f, protocol=5).dump(obj)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        pass
+
+
+class _ParserPickler(pickle.Pickler):
+    """Pickles argparse objects that plain pickle cannot round-trip.
+
+    ArgumentParser registers a local 'identity' function as the default type,
+    and argparse compares against SUPPRESS by identity, so both are stored as
+    references and restored from the running argparse module.
+    """
+
+    def persistent_id(self, obj):
+        if obj is argparse.SUPPRESS:
+            return "SUPPRESS"
+        if getattr(obj, "__qualname__", None) == "ArgumentParser.__init__.<locals>.identity":
+            return "identity"
+        return None
+
+
+class _ParserUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        if pid == "SUPPRESS":
+            return argparse.SUPPRESS
+        if pid == "identity":
+            return lambda string: string
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def _cached_parser() -> argparse.ArgumentParser:
+    """Return the full parser, reusing a pickled copy while build.py is unchanged."""
+    key = repr((FRONTENDS, PLUGINS, os.path.getmtime(__file__), sys.version))
+    header = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    cache_path = CACHE_DIR / "parser.pkl"
+
+    parser = _read_cache(cache_path, header, _ParserUnpickler)
+    if parser is _CACHE_MISS:
+        parser = _build_parser()
+        _write_cache(cache_path, header, parser, _ParserPickler)
+    return parser
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -101,22 +278,22 @@ def _build_parser() -> argparse.ArgumentParser:
     # Generate only or full build
     p.add_argument("-c", dest="configure", action="count",
                    help=(
-                       "-c :  Run CMake configure step\n"
-                       "-cc : Run CMake configure step and exit (do not build)\n"
+                       "-c :  Run CMake configure step, skipped when the configuration is unchanged\n"
+                       "-cc : Run CMake configure step and exit (do not build), always configures\n"
                    ))
+    p.add_argument("--reconfigure", action="store_true",
+                   help="Run CMake configure step even if the configuration is unchanged (implies -c)")
     # Build type
     p.add_argument("-b", "--build-type", metavar="TYPE", default="Release",
-                   choices=["Release", "Debug", "RelWithDebInfo"], help="CMAKE_BUILD_TYPE")
+                   choices=BUILD_TYPES, help="CMAKE_BUILD_TYPE (build configuration with --multi-config)")
     p.add_argument("-j", "--parallel", nargs="?", const=-1, type=int, default=None,
-                   help='The maximum number of concurrent processes to use when building')
+                   help='The maximum number of concurrent processes to use when building, passed as '
+                        'CMAKE_BUILD_PARALLEL_LEVEL. Without -j (or with -j 0), an existing '
+                        'CMAKE_BUILD_PARALLEL_LEVEL or nproc-2 is used; bare -j leaves it to the native build tool')
 
     # Feature toggles (on / off)
-    for flag in ON_OFF_FLAGS:
-        p.add_argument(
-            f"--enable-{flag.replace('_', '-')}",
-            choices=["on", "off"],
-            help=f"ENABLE_{flag.upper()} (ON / OFF)"
-        )
+    for flag, help_ in _ON_OFF_ARGS:
+        p.add_argument(flag, choices=_ON_OFF_CHOICES, help=help_)
 
     # Another way to enable plugins
     p.add_argument(
@@ -152,31 +329,36 @@ def _build_parser() -> argparse.ArgumentParser:
     # Ccache
     p.add_argument("--use-ccache", dest="use_ccache", action="store_true", default=True, help="Enable ccache")
     # Architecture
-    p.add_argument("-a", "--arch", choices=["x86", "arm", "arm32", "riscv"],
+    p.add_argument("-a", "--arch", choices=list(TOOLCHAINS),
                    help="Target architecture for cross-compilation")
     p.add_argument("--native-compilation", action="store_true", help="Enable -march=native")
     # Profiling
     p.add_argument("-u", "--gprof", action="store_true", help="Enable gprof instrumentation")
     p.add_argument("--linux-perf", action="store_true", help="Add flags useful for Linux perf")
     # Tooling
-    p.add_argument("--use-mold", action="store_true", help="Use mold linker")
+    p.add_argument("--use-mold", action="store_true", help="Use mold linker (falls back to lld)")
     p.add_argument("--use-ninja", action="store_true", help="Use Ninja build system")
+    p.add_argument("--multi-config", action="store_true",
+                   help="Use the 'Ninja Multi-Config' generator (ninja 1.10+): one build dir for all build types, "
+                        "-b selects the configuration at build time")
     p.add_argument("--use-clang", metavar="VER", help="Use specific clang version")
+    p.add_argument("--use-presets", action="store_true",
+                   help=f"Store the configuration as preset '{PRESET_NAME}' in {PRESETS_FILE} "
+                        "of the source tree and configure with 'cmake --preset'; "
+                        "-c then runs 'cmake --workflow' (CMake 3.25+)")
+    p.add_argument("--cmake-init-cache", action="store_true",
+                   help=f"Pass generated definitions through {INIT_CACHE_FILE} in the build dir "
+                        "('cmake -C') instead of -D arguments (ignored with --use-presets)")
     # Verbosity
     p.add_argument("-v", dest="verbose", action="count", help="Increase verbosity (-v, -vv, -vvv)", default=1)
     p.add_argument("-q", "--quiet", action="count",
                    help="Reduce build verbosity (-q: disable rule messages, -qq: disable rule and target messages)",
                    default=0)
-    # Shell completion emission
-    p.add_argument("--completion", choices=["bash", "zsh", "fish"],
-                   help="Generate shell completion script for specified shell")
-    # Configuration export/import
+    # Shell completion emission and configuration import
+    _add_early_args(p)
+    # Configuration export
     p.add_argument("--export", dest="export_file", metavar="FILE",
                    help="Export current parameters to a YAML file and exit")
-    p.add_argument("--import", dest="import_file", nargs='?', const=".build", metavar="FILE",
-                   help="Import parameters from a YAML file (default '.build')")
-    p.add_argument("--ignore-config", action="store_true",
-                   help="Ignore the default .build configuration file")
     # Extra arguments
     p.add_argument("--cmake-extra-defines", nargs="+",
                    help="Extra CMake definitions (-D<key>=<value>). Provide as <key>=<value>.")
@@ -190,9 +372,42 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("target", nargs=argparse.REMAINDER,
                    help="Targets passed verbatim to 'cmake --build'")
 
-    argcomplete.autocomplete(p)
     # Installation to generate completions at runtime is handled via --completion flag
 
+    # Cached for config file validation, which may run more than once
+    p._valid_dests = frozenset(action.dest for action in p._actions)
+    return p
+
+
+def _add_early_args(p: argparse.ArgumentParser) -> None:
+    """Add the flags shared by the minimal and the full parser."""
+    p.add_argument("--completion", choices=["bash", "zsh", "fish"],
+                   help="Generate shell completion script for specified shell")
+    p.add_argument("--import", dest="import_file", nargs='?', const=".build", metavar="FILE",
+                   help="Import parameters from a YAML file (default '.build')")
+    p.add_argument("--ignore-config", action="store_true",
+                   help="Ignore the default .build configuration file "
+                        "(also enabled by setting OV_BUILD_IGNORE_CONFIG=1)")
+
+
+_EARLY_FLAGS = ("--completion", "--import", "--ignore-config")
+
+
+def _has_early_args(argv: List[str]) -> bool:
+    """Check whether argv may contain one of the early flags, abbreviations included."""
+    for token in argv:
+        if token == "--":
+            break
+        opt = token.split("=", 1)[0]
+        if len(opt) > 2 and opt.startswith("--") and any(flag.startswith(opt) for flag in _EARLY_FLAGS):
+            return True
+    return False
+
+
+def _build_minimal_parser() -> argparse.ArgumentParser:
+    """Parser for the flags that must be known before the full parser is built."""
+    p = argparse.ArgumentParser(add_help=False)
+    _add_early_args(p)
     return p
 
 
@@ -200,20 +415,33 @@ def _initial_env(args) -> None:
     if args.use_ccache:
         os.environ.setdefault("CCACHE_DIR", str(Path.home() / ".ccache"))
         os.environ.setdefault("CCACHE_MAXSIZE", "50G")
+        # Cheap compression, fits more objects into the cache
+        os.environ.setdefault("CCACHE_COMPRESS", "true")
+        os.environ.setdefault("CCACHE_COMPRESSLEVEL", "1")
+        # Hash the compiler binary itself, safe when switching toolchains
+        os.environ.setdefault("CCACHE_COMPILERCHECK", "content")
+    # Collect flag additions first and update each variable once
+    adds: defaultdict[str, List[str]] = defaultdict(list)
     if args.native_compilation:
         for var in ("CFLAGS", "CXXFLAGS", "LDFLAGS"):
-            os.environ[var] = os.environ.get(var, "") + " -march=native"
+            adds[var].append("-march=native")
     if args.linux_perf:
         for var in ("CFLAGS", "CXXFLAGS"):
-            os.environ[var] = os.environ.get(var, "") + " -fno-omit-frame-pointer -g -ggdb"
-        os.environ["LDFLAGS"] = os.environ.get("LDFLAGS", "") + " -g"
+            adds[var].append("-fno-omit-frame-pointer -g -ggdb")
+        adds["LDFLAGS"].append("-g")
     if args.gprof:
         for var in ("CFLAGS", "CXXFLAGS"):
-            os.environ[var] = os.environ.get(var, "") + " -fno-omit-frame-pointer -g -pg"
-        os.environ["LDFLAGS"] = os.environ.get("LDFLAGS", "") + " -g -pg"
+            adds[var].append("-fno-omit-frame-pointer -g -pg")
+        adds["LDFLAGS"].append("-g -pg")
+    for var, flags in adds.items():
+        os.environ[var] = (os.environ.get(var, "") + " " + " ".join(flags)).strip()
+    if args.parallel and args.parallel != -1:
+        # Honored by every generator, including nested cmake --build invocations
+        os.environ["CMAKE_BUILD_PARALLEL_LEVEL"] = str(args.parallel)
     if args.use_clang:
-        os.environ["CC"] = f"/usr/bin/clang-{args.use_clang}"
-        os.environ["CXX"] = f"/usr/bin/clang++-{args.use_clang}"
+        # Prefer whatever PATH provides (nix, custom prefixes), /usr/bin otherwise
+        os.environ["CC"] = _which(f"clang-{args.use_clang}") or f"/usr/bin/clang-{args.use_clang}"
+        os.environ["CXX"] = _which(f"clang++-{args.use_clang}") or f"/usr/bin/clang++-{args.use_clang}"
 
 
 def _compute_build_dir(args) -> str:
@@ -228,51 +456,52 @@ def _compute_build_dir(args) -> str:
         suffix += f"_{args.enable_sanitizer}"
     if args.enable_openvino_debug:
         suffix += "_ov_debug"
+    if args.multi_config:
+        # One build dir holds every configuration
+        return f"build_multi{suffix}"
     return f"build_{args.build_type}{suffix}"
 
 
 def _collect_cmake_defs(args, root_path: Path) -> dict[str, str]:
     defs: dict[str, str] = {
-        "CMAKE_BUILD_TYPE": args.build_type,
         "CMAKE_EXPORT_COMPILE_COMMANDS": "ON",
         # Set OUTPUT_ROOT to command line argument or default to source directory
         "OUTPUT_ROOT": args.output_root or str(root_path),
     }
+    if args.multi_config:
+        # Build type is picked at build time, switching it needs no reconfigure
+        defs["CMAKE_CONFIGURATION_TYPES"] = ";".join(BUILD_TYPES)
+    else:
+        defs["CMAKE_BUILD_TYPE"] = args.build_type
 
     # Add quiet mode cmake option
-    if not args.use_ninja:
+    if not args.use_ninja and not args.multi_config:
         if args.quiet >= 1:
             defs["CMAKE_RULE_MESSAGES"] = "OFF"
         if args.quiet >= 2:
             defs["CMAKE_TARGET_MESSAGES"] = "OFF"
 
-    # Generic --enable_* flags
-    for name, value in vars(args).items():
-        if name.startswith("enable_"):
-            if name in [f"enable_{fe}" for fe in FRONTENDS] + \
-                       [f"enable_{pl}" for pl in PLUGINS]:
-                continue
-
-            key = name[len("enable_"):].upper()
-            if value in ("on", "off"):
-                defs[f"ENABLE_{key}"] = value.upper()
-            elif value is not None:
-                flag_name = name[len('enable_'):]
-                raise ValueError(f"Invalid value '{value}' for --enable-{flag_name}. Expected 'on' or 'off'.")
+    # Generic --enable-* ON/OFF flags
+    for flag, attr, key in _ENABLE_SPECS:
+        value = getattr(args, attr, None)
+        if value in ("on", "off"):
+            defs[key] = value.upper()
+        elif value is not None:
+            raise ValueError(f"Invalid value '{value}' for --enable-{flag.replace('_', '-')}. Expected 'on' or 'off'.")
 
     # Threading
     defs["THREADING"] = args.threading
     # ccache
     if args.use_ccache:
-        defs["CMAKE_CXX_COMPILER_LAUNCHER"] = "ccache"
-    # Frontends
-    if args.frontends:
-        for fe in args.frontends:
-            defs[f"ENABLE_OV_{fe.upper()}_FRONTEND"] = "ON"
-    # Plugins
-    if args.plugins:
-        for pl in args.plugins:
-            defs[f"ENABLE_{pl.upper()}"] = "ON"
+        launcher = _compiler_launcher()
+        if launcher:
+            defs["CMAKE_C_COMPILER_LAUNCHER"] = launcher
+            defs["CMAKE_CXX_COMPILER_LAUNCHER"] = launcher
+    # Frontends and plugins, override the matching --enable-* value
+    for fe in args.frontends or ():
+        defs[_FRONTEND_KEYS[fe]] = "ON"
+    for pl in args.plugins or ():
+        defs[_PLUGIN_KEYS[pl]] = "ON"
     # Conditional compilation
     if args.enable_cc == 'collect':
         defs['SELECTIVE_BUILD'] = 'COLLECT'
@@ -281,62 +510,193 @@ def _collect_cmake_defs(args, root_path: Path) -> dict[str, str]:
         defs['SELECTIVE_BUILD'] = 'ON'
         defs['ENABLE_PROFILING_ITT'] = 'OFF'
         defs['SELECTIVE_BUILD_STAT'] = args.cc_stat_file
-    # Mold linker
+    # Mold linker, lld as a fallback
     if args.use_mold:
-        mold = "-fuse-ld=mold"
-        defs.update({
-            'CMAKE_EXE_LINKER_FLAGS': mold,
-            'CMAKE_SHARED_LINKER_FLAGS': mold,
-            'CMAKE_MODULE_LINKER_FLAGS': mold,
-        })
+        linker = _fast_linker()
+        if linker:
+            fuse_ld = f"-fuse-ld={linker}"
+            defs.update({
+                'CMAKE_EXE_LINKER_FLAGS': fuse_ld,
+                'CMAKE_SHARED_LINKER_FLAGS': fuse_ld,
+                'CMAKE_MODULE_LINKER_FLAGS': fuse_ld,
+            })
     if args.arch:
         # Toolchain
-        toolchains = {
-            "x86": "cmake/toolchains/x86_64.linux.toolchain.cmake",
-            "arm": "cmake/arm64.toolchain.cmake",
-            "arm32": "cmake/arm.toolchain.cmake",
-            "riscv": "cmake/toolchains/riscv64-100-xuantie-gnu.toolchain.cmake",
-        }
-
-        defs['CMAKE_TOOLCHAIN_FILE'] = toolchains[args.arch]
+        defs['CMAKE_TOOLCHAIN_FILE'] = TOOLCHAINS[args.arch]
         if args.arch == 'riscv':
             defs['RISCV_TOOLCHAIN_ROOT'] = '/opt/riscv'
     return defs
 
 
-def _cmake_options(args, root_path: Path) -> List[str]:
-    options = [f"-D{k}={v}" for k, v in _collect_cmake_defs(args, root_path).items()]
-
-    # Add extra defines
+def _extra_define_options(args) -> List[str]:
+    options = []
     if args.cmake_extra_defines:
         for define in args.cmake_extra_defines:
             if '=' in define:
                 options.append(f"-D{define}")
             else:
                 options.append(f"-D{define}=ON")
+    return options
 
+
+def _cmake_options(args, defs: dict[str, str]) -> List[str]:
+    # Sorted so the same configuration always yields the same command line
+    options = [f"-D{k}={v}" for k, v in sorted(defs.items())]
+    # Extra defines go last so they can override generated ones
+    options.extend(_extra_define_options(args))
     return options
 
 
+def _cmake_quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$') + '"'
+
+
+def _write_init_cache(path: Path, defs: dict[str, str]) -> None:
+    """Write the generated definitions as a CMake initial-cache script for 'cmake -C'."""
+    lines = ["# Generated by build.py, passed to cmake -C\n"]
+    for k, v in sorted(defs.items()):
+        cache_type = "BOOL" if v in ("ON", "OFF") else "STRING"
+        lines.append(f'set({k} {_cmake_quote(v)} CACHE {cache_type} "" FORCE)\n')
+    text = "".join(lines)
+    if _read_text(path) != text:
+        path.write_text(text)
+
+
+def _preset_cache_variables(args, defs: dict[str, str]) -> dict:
+    """Generated definitions plus --cmake-extra-defines, as preset cacheVariables.
+
+    Used for 'cmake --workflow', which accepts no -D or --log-level arguments. The log level
+    is left out on purpose: as CMAKE_MESSAGE_LOG_LEVEL it would stick in CMakeCache.txt and
+    apply to every later regeneration, so the workflow configures at CMake's default level.
+    """
+    cache_variables: dict = dict(defs)
+    for define in args.cmake_extra_defines or ():
+        key, sep, value = define.partition('=')
+        name, _, cache_type = key.partition(':')
+        value = value if sep else "ON"
+        cache_variables[name] = {"type": cache_type, "value": value} if cache_type else value
+    return cache_variables
+
+
+def _write_preset(root: Path, binary_dir: Path, cache_variables: dict, generator: str | None,
+                  build: dict | None = None) -> None:
+    """Add or update the build.py presets in <root>/CMakeUserPresets.json.
+
+    With build given, also writes a build preset and a configure+build workflow preset.
+    Presets defined by the user in the same file are preserved.
+    """
+    import json
+
+    path = root / PRESETS_FILE
+    text = _read_text(path)
+    try:
+        presets = json.loads(text) if text else {}
+    except ValueError as e:
+        print(f"Error: Unable to parse {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    def replace(kind: str, preset: dict) -> None:
+        presets[kind] = [p for p in presets.get(kind, []) if p.get("name") != preset["name"]] + [preset]
+
+    preset = {"name": PRESET_NAME, "binaryDir": str(binary_dir),
+              "cacheVariables": dict(sorted(cache_variables.items()))}
+    if generator:
+        preset["generator"] = generator
+    replace("configurePresets", preset)
+    version = PRESETS_VERSION
+
+    if build is not None:
+        replace("buildPresets", {"name": PRESET_NAME, "configurePreset": PRESET_NAME, **build})
+        replace("workflowPresets", {"name": WORKFLOW_PRESET_NAME, "steps": [
+            {"type": "configure", "name": PRESET_NAME},
+            {"type": "build", "name": PRESET_NAME},
+        ]})
+        version = WORKFLOW_PRESETS_VERSION
+    presets["version"] = max(presets.get("version", 0), version)
+
+    new_text = json.dumps(presets, indent=2) + "\n"
+    if new_text != text:
+        path.write_text(new_text)
+
+
+def _configure_digest(cmake_cmd: List[str], defs: dict[str, str], generator: str | None, binary_dir: Path) -> str:
+    """Hash everything that feeds the configure step: the command, definitions, generator,
+    binary dir and compiler env.
+
+    The generator and binary dir are hashed explicitly, with --use-presets they are not on
+    the command line. The log level only affects output, so changing verbosity does not
+    force a reconfigure.
+    """
+    cmd = [arg for arg in cmake_cmd if not arg.startswith("--log-level=")]
+    env = [os.environ.get(var) for var in CONFIGURE_ENV_VARS]
+    key = (cmd, sorted(defs.items()), generator, str(binary_dir), env)
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _add_flag(cmd: list[str], flag: str, value) -> None:
+    cmd.append(flag)
+
+
+def _add_bool_flag(cmd: list[str], flag: str, value: bool) -> None:
+    if value:
+        cmd.append(flag)
+
+
+def _add_flag_values(cmd: list[str], flag: str, value) -> None:
+    cmd.append(flag)
+    cmd.extend(str(v) for v in value)
+
+
+def _add_flag_value(cmd: list[str], flag: str, value) -> None:
+    cmd.extend([flag, str(value)])
+
+
+# add_arg handlers by exact value type; anything else is a single value
+_ADD_ARG_DISPATCH = {
+    type(None): _add_flag,
+    bool: _add_bool_flag,
+    list: _add_flag_values,
+    tuple: _add_flag_values,
+}
+
+
 def add_arg(cmd: list[str], flag: str, value=None):
     """
     - If value is truthy and not a list/tuple → append flag + single value
     - If value is a list/tuple         → append flag + all values
     - If value is None or True (boolean flag)  → append flag only
+    - If value is False                → append nothing
     """
-    if value is None:
-        # flag with no value
-        cmd.append(flag)
-    elif value is True:
-        # boolean flag, no value
-        cmd.append(flag)
-    elif isinstance(value, (list, tuple)):
-        # flag followed by multiple values
-        cmd.append(flag)
-        cmd.extend(str(v) for v in value)
-    elif value is not None:
-        # flag followed by a single value
-        cmd.extend([flag, str(value)])
+    _ADD_ARG_DISPATCH.get(type(value), _add_flag_value)(cmd, flag, value)
+
+
+def _load_yaml_cached(file_path: str):
+    """Load a YAML file, reusing a pickled copy while the file is unchanged."""
+    st = os.stat(file_path)
+    header = _CACHE_HEADER.pack(st.st_mtime_ns, st.st_size)
+    key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / f"{key}.cache.pkl"
+
+    loaded = _read_cache(cache_path, header)
+    if loaded is not _CACHE_MISS:
+        return loaded
+
+    # External package, json is too verbose
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(file_path, "rb") as f:
+        loaded = yaml.load(f, Loader=loader)
+
+    _write_cache(cache_path, header, loaded)
+    return loaded
 
 
 def _load_config_file(file_path: str, parser: argparse.ArgumentParser, is_error_fatal: bool = True) -> dict:
@@ -351,8 +711,7 @@ def _load_config_file(file_path: str, parser: argparse.ArgumentParser, is_error_
         Dictionary of valid configuration options
     """
     try:
-        with open(file_path) as f:
-            loaded = yaml.safe_load(f) or {}
+        loaded = _load_yaml_cached(file_path) or {}
     except Exception as e:
         if is_error_fatal:
             print(f"Error: Unable to load import file {file_path}: {e}", file=sys.stderr)
@@ -362,10 +721,9 @@ def _load_config_file(file_path: str, parser: argparse.ArgumentParser, is_error_
             return {}
 
     # Filter only valid options
-    valid_dests = {action.dest for action in parser._actions}
     valid_config = {}
     for k, v in loaded.items():
-        if k in valid_dests:
+        if k in parser._valid_dests:
             valid_config[k] = v
         else:
             file_type = "import" if is_error_fatal else Path(file_path).name
@@ -374,22 +732,27 @@ def _load_config_file(file_path: str, parser: argparse.ArgumentParser, is_error_
     return valid_config
 
 
-def import_if_provided(parser: argparse.ArgumentParser) -> tuple[argparse.Namespace, dict]:
+def import_if_provided(parser: argparse.ArgumentParser, known_args: argparse.Namespace,
+                       remaining_argv: List[str]) -> tuple[argparse.Namespace, dict]:
     """Handle configuration import and return parsed arguments with defaults.
 
     Performs two-phase parsing:
-    1. Extract --import and --ignore-config flags
+    1. --import and --ignore-config flags are extracted by the minimal parser
     2. Load .build by default unless --ignore-config is specified
     3. Load --import file if specified (overrides .build defaults)
     4. Parse all arguments with loaded defaults applied
 
+    Args:
+        parser: Full argument parser
+        known_args: Namespace produced by the minimal parser
+        remaining_argv: Arguments left over after the minimal parse
+
     Returns:
         Tuple of (parsed arguments namespace, defaults dict from import file)
     """
-    import_parser = argparse.ArgumentParser(add_help=False)
-    import_parser.add_argument("--import", dest="import_file", nargs='?', const=".build", metavar="FILE")
-    import_parser.add_argument("--ignore-config", action="store_true")
-    known_args, remaining_argv = import_parser.parse_known_args()
+    # Batch/CI runs can skip .build without touching the command line
+    if os.environ.get("OV_BUILD_IGNORE_CONFIG", "") not in ("", "0"):
+        known_args.ignore_config = True
 
     defaults: dict = {}
 
@@ -427,10 +790,12 @@ def export_args(parser: argparse.ArgumentParser, args: argparse.Namespace, defau
     # Determine which parameters were explicitly provided via import or CLI
     provided = set(defaults.keys())
     # CLI-provided flags
-    for action in parser._actions:
-        for opt in action.option_strings:
-            if opt in sys.argv:
-                provided.add(action.dest)
+    for token in sys.argv:
+        action = parser._option_string_actions.get(token)
+        if action is not None:
+            provided.add(action.dest)
+
+    import yaml
 
     to_export: dict = {}
     for name, value in vars(args).items():
@@ -441,7 +806,9 @@ def export_args(parser: argparse.ArgumentParser, args: argparse.Namespace, defau
         to_export[name] = value
     try:
         with open(args.export_file, 'w') as f:
-            yaml.safe_dump(to_export, f)
+            # libyaml emitter when available; keep argparse order for readable diffs
+            yaml.dump(to_export, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                      default_flow_style=False, sort_keys=False, width=1000)
         print(f"Exported parameters to {args.export_file}")
     except Exception as e:
         print(f"Error: Unable to export to file {args.export_file}: {e}", file=sys.stderr)
@@ -449,85 +816,162 @@ def export_args(parser: argparse.ArgumentParser, args: argparse.Namespace, defau
 
 
 def run() -> None:
-    root = find_repo_root()
-    parser = _build_parser()
-    args, defaults = import_if_provided(parser)
-
-    # Handle export
-    if args.export_file:
-        export_args(parser, args, defaults)
-        return
-
-    # Shell completion provisioning
-    if args.completion:
+    if _has_early_args(sys.argv[1:]):
+        known_args, remaining_argv = _build_minimal_parser().parse_known_args()
+    else:
+        # Common case: skip the pre-parse, the full parser sees argv only once
+        known_args = argparse.Namespace(completion=None, import_file=None, ignore_config=False)
+        remaining_argv = sys.argv[1:]
+
+    # Shell completion provisioning, does not need the full parser
+    if known_args.completion:
+        import argcomplete
         exe = Path(sys.argv[0]).stem
         executables = [exe, exe + ".py"]
         code = argcomplete.shellcode(
             executables,
-            shell=args.completion,
+            shell=known_args.completion,
             use_defaults=True
         )
         sys.stdout.write(code)
         sys.exit(0)
 
+    parser = _cached_parser()
+    # Only pay for importing argcomplete when the shell is actually completing
+    if "_ARGCOMPLETE" in os.environ:
+        import argcomplete
+        argcomplete.autocomplete(parser)
+
+    args, defaults = import_if_provided(parser, known_args, remaining_argv)
+
+    # Handle export
+    if args.export_file:
+        export_args(parser, args, defaults)
+        return
+
+    root = find_repo_root()
+
     # Validate selective compilation
     if args.enable_cc == 'apply' and not args.cc_stat_file:
         print("Error: --cc-stat-file is required when --enable-cc apply", file=sys.stderr)
         sys.exit(1)
 
     # Strip argparse sentinel
-    if args.target and len(args.target) > 0 and args.target[0] == "--":
+    if args.target and args.target[0] == "--":
         args.target = args.target[1:]
 
     # Locate CMake
-    cmake_path = shutil.which('cmake')
+    # CMAKE may preselect a specific binary (name or path)
+    cmake_name = os.environ.get('CMAKE') or 'cmake'
+    cmake_path = _which(cmake_name)
     if not cmake_path:
-        print('Error: cmake not found in PATH', file=sys.stderr)
+        print(f'Error: {cmake_name} not found in PATH', file=sys.stderr)
         sys.exit(1)
 
-    # @todo: Consider fallback behavior when ninja is not available
-    generator = ['-G', 'Ninja'] if args.use_ninja and shutil.which('ninja') else []
     # Prepare build dir
     build_dir = Path(_compute_build_dir(args))
-    build_dir.mkdir(parents=True, exist_ok=True)
+    # cmake runs from the repo root, so that is where the build dir lives;
+    # it usually exists already, a single stat covers that case
+    if not os.path.isdir(root / build_dir):
+        os.makedirs(root / build_dir, exist_ok=True)
+    # Build in parallel by default (also for -j 0), some generators are serial otherwise
+    if not args.parallel and "CMAKE_BUILD_PARALLEL_LEVEL" not in os.environ:
+        args.parallel = _nprocs_minus_two()
     _initial_env(args)
 
     # quiet overrules verbosity
     if args.quiet > 0:
         args.verbose = 0
 
-    cmake_cmd = [
-        cmake_path,
-        *generator,
-        f"--log-level={'DEBUG' if args.verbose else 'ERROR'}",
-        *_cmake_options(args, root),
-        str(root),
-        '-B', str(build_dir)
-    ]
-
-    # Add extra CMake configure args
-    if args.cmake_extra_configure_args:
-        cmake_cmd.extend(args.cmake_extra_configure_args)
-
-    if args.verbose > 2:
-        print('CMake command:', ' '.join(cmake_cmd))
-        print('Build dir:', build_dir)
-
-    # Configure step
+    # Configure step, -c skips it when nothing that affects it has changed
+    if args.reconfigure and not args.configure:
+        args.configure = 1
     if args.configure and args.configure > 0:
-        subprocess.run(cmake_cmd, check=True, cwd=root)
+        # An existing build dir already fixes the generator, so only configuring needs it
+        if args.multi_config:
+            if not _ninja_supports_multi_config():
+                print('Error: --multi-config requires ninja 1.10 or newer in PATH', file=sys.stderr)
+                sys.exit(1)
+            generator = ['-G', 'Ninja Multi-Config']
+        else:
+            # @todo: Consider fallback behavior when ninja is not available
+            generator = ['-G', 'Ninja'] if args.use_ninja and _which('ninja') else []
+        log_level = f"--log-level={CMAKE_LOG_LEVELS.get(args.verbose, 'DEBUG')}"
+        # Definitions probe PATH for the compiler cache and linker, only needed to configure
+        defs = _collect_cmake_defs(args, root)
+        if args.use_presets:
+            # Generated definitions and generator live in the preset, see _write_preset
+            cmake_cmd = [cmake_path, '--preset', PRESET_NAME, log_level, *_extra_define_options(args)]
+        elif args.cmake_init_cache:
+            # Generated definitions are read from an initial-cache script, see _write_init_cache
+            cmake_cmd = [
+                cmake_path,
+                *generator,
+                log_level,
+                '-C', str(root / build_dir / INIT_CACHE_FILE),
+                *_extra_define_options(args),
+                str(root),
+                '-B', str(build_dir)
+            ]
+        else:
+            cmake_cmd = [
+                cmake_path,
+                *generator,
+                log_level,
+                *_cmake_options(args, defs),
+                str(root),
+                '-B', str(build_dir)
+            ]
+
+        # Add extra CMake configure args
+        if args.cmake_extra_configure_args:
+            cmake_cmd.extend(args.cmake_extra_configure_args)
+
+        if args.verbose > 2:
+            print('CMake command:', ' '.join(cmake_cmd))
+            print('Build dir:', build_dir)
+
+        stamp = root / build_dir / CONFIGURE_STAMP
+        digest = _configure_digest(cmake_cmd, defs, generator[1] if generator else None, root / build_dir)
+        force = args.reconfigure or args.configure > 1
+        if not force and (root / build_dir / "CMakeCache.txt").exists() and _read_text(stamp) == digest:
+            if args.verbose > 0:
+                print("Configuration unchanged, skipping CMake configure (use --reconfigure to force)")
+        elif args.use_presets and args.configure == 1 and \
+                not (args.cmake_extra_configure_args or args.cmake_extra_build_args):
+            # Configure and build in a single cmake process; extra raw arguments need the two-step path
+            build = {"targets": args.target} if args.target else {}
+            if args.multi_config:
+                build["configuration"] = args.build_type
+            if args.verbose == 0:
+                build["nativeToolOptions"] = ["--quiet"]
+            _write_preset(root, root / build_dir, _preset_cache_variables(args, defs),
+                          generator[1] if generator else None, build)
+            workflow_cmd = [cmake_path, '--workflow', '--preset', WORKFLOW_PRESET_NAME]
+            if args.verbose > 2:
+                print('Workflow command:', ' '.join(workflow_cmd))
+            subprocess.run(workflow_cmd, check=True, cwd=root)
+            stamp.write_text(digest)
+            return
+        else:
+            if args.use_presets:
+                _write_preset(root, root / build_dir, defs, generator[1] if generator else None)
+            elif args.cmake_init_cache:
+                _write_init_cache(root / build_dir / INIT_CACHE_FILE, defs)
+            subprocess.run(cmake_cmd, check=True, cwd=root)
+            stamp.write_text(digest)
         # Exit after configure if -cc or --configure-only
         if (args.configure and args.configure > 1):
             return
 
     # Build step
     build_cmd = [cmake_path, '--build', str(build_dir)]
+    if args.multi_config:
+        add_arg(build_cmd, '--config', args.build_type)
 
-    if args.parallel is not None:
-        if args.parallel != -1:
-            add_arg(build_cmd, '--parallel', args.parallel)
-        else:
-            add_arg(build_cmd, '--parallel')
+    # Job count goes through CMAKE_BUILD_PARALLEL_LEVEL, see _initial_env
+    if args.parallel == -1:
+        add_arg(build_cmd, '--parallel')
 
     if args.target:
         add_arg(build_cmd, '--target', args.target)
@@ -541,8 +985,13 @@ def run() -> None:
 
     if args.verbose > 2:
         print('Build command:', ' '.join(build_cmd))
+        print('CMAKE_BUILD_PARALLEL_LEVEL:', os.environ.get('CMAKE_BUILD_PARALLEL_LEVEL'))
 
-    subprocess.run(build_cmd, check=True, cwd=root)
+    # Nothing left to do afterwards, so let cmake replace this process
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.chdir(root)
+    os.execv(cmake_path, build_cmd)
 
 
 if __name__ == '__main__':
@@ -551,3 +1000,6 @@ if __name__ == '__main__':
     except subprocess.CalledProcessError as e:
         print(f"Command failed with exit code {e.returncode}")
         sys.exit(e.returncode)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
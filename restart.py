@@ -6,15 +6,101 @@ A Python clone of restart.sh with improved modularity and readability.
 Provides interactive selection of PRs and failed/pending CI jobs for restart.
 """
 
+import functools
+import hashlib
 import json
+import netrc
+import os
 import subprocess
 import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import requests
+import urllib3
+
+
+# Short-lived cache of GitHub responses, saves the round trip when re-running
+# the script on the same PR
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'restart-py'
+CACHE_TTL = 30  # seconds
+
+# Check conclusions/states (lowercased) counted as failed or pending
+FAILED_STATES = frozenset({'failure', 'error', 'cancelled', 'timed_out'})
+PENDING_STATES = frozenset({'pending', 'queued', 'in_progress', 'requested', 'waiting'})
+
+# Upper bound on concurrent job restarts
+RESTART_WORKERS = 8
+
+# One round trip for everything the script needs: the user's open PRs, the
+# check rollup of their head commits (for the CI state), the commit statuses
+# (Jenkins; unpaginated, unlike the rollup that mixes them with every check run)
+# and the GitHub Actions runs attached to those commits.
+PRS_QUERY = """
+query($search: String!, $limit: Int!) {
+  search(query: $search, type: ISSUE, first: $limit) {
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        author { login }
+        headRefOid
+        commits(last: 1) {
+          nodes {
+            commit {
+              statusCheckRollup {
+                contexts(first: 100) {
+                  nodes {
+                    __typename
+                    ... on CheckRun { conclusion status }
+                    ... on StatusContext { state }
+                  }
+                }
+              }
+              status {
+                contexts { state context targetUrl createdAt }
+              }
+              checkSuites(first: 100) {
+                nodes {
+                  workflowRun { databaseId runNumber event workflow { name } }
+                  conclusion
+                  status
+                  createdAt
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Projection applied by gh itself, so that only the fields the script uses
+# reach Python: the check states of each PR, its commit statuses (Jenkins) and
+# its workflow runs, with states already lowercased
+PRS_JQ = """
+[.data.search.nodes[] | (.commits.nodes[0].commit // {}) as $commit | {
+  number, title, author: .author.login, headRefOid,
+  states: [$commit.statusCheckRollup.contexts.nodes[]?
+           | (.conclusion // .status // .state // "") | ascii_downcase],
+  statuses: [$commit.status.contexts[]?
+             | {state: (.state | ascii_downcase), context, targetUrl, createdAt}],
+  runs: [$commit.checkSuites.nodes[]? | select(.workflowRun)
+         | {databaseId: .workflowRun.databaseId, workflowName: .workflowRun.workflow.name,
+            runNumber: .workflowRun.runNumber, event: .workflowRun.event,
+            conclusion: ((.conclusion // "") | ascii_downcase),
+            status: ((.status // "") | ascii_downcase), createdAt}]
+}]
+"""
+
 
 @dataclass
 class PRInfo:
@@ -26,6 +112,8 @@ class PRInfo:
     ci_state: str
     failed_count: int
     pending_count: int
+    github_jobs: List['JobInfo'] = field(default_factory=list)
+    jenkins_jobs: List['JobInfo'] = field(default_factory=list)
 
 
 @dataclass
@@ -39,14 +127,28 @@ class JobInfo:
     created_at: str
 
 
+@functools.lru_cache(maxsize=1024)
+def _fmt_ts(timestamp: str) -> str:
+    """Format an ISO timestamp for the job list. Jobs of one commit often share it."""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%m-%d %H:%M')
+    except (ValueError, AttributeError):
+        return timestamp
+
+
 class DependencyChecker:
     """Checks for required command-line tools."""
 
-    REQUIRED_TOOLS = ['fzf', 'gh', 'curl', 'jq']
+    REQUIRED_TOOLS = ['fzf', 'gh', 'jq']
 
     @staticmethod
     def check_dependencies() -> None:
-        """Check if all required tools are available."""
+        """Check if all required tools are available. A successful check is remembered per PATH."""
+        path_key = hashlib.blake2b(os.environ.get('PATH', '').encode(), digest_size=8).hexdigest()
+        marker = CACHE_DIR / f'deps-{path_key}'
+        if marker.exists():
+            return
+
         missing = []
         for tool in DependencyChecker.REQUIRED_TOOLS:
             if not shutil.which(tool):
@@ -56,6 +158,12 @@ class DependencyChecker:
             print(f"Error: Missing required tools: {', '.join(missing)}", file=sys.stderr)
             sys.exit(1)
 
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
+
 
 class GitHubClient:
     """Handles GitHub API interactions using gh CLI."""
@@ -76,20 +184,59 @@ class GitHubClient:
             print(f"Error getting repository info: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def _gql(self, query: str, variables: Dict[str, Any], jq: str = '.data') -> Any:
+        """Run a GraphQL query through gh and return the response filtered by jq."""
+        cmd = ['gh', 'api', 'graphql', '-f', f'query={query}', '--jq', jq]
+        for key, value in variables.items():
+            # -F sends ints as typed values, -f keeps strings verbatim
+            cmd += ['-F' if isinstance(value, int) else '-f', f'{key}={value}']
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    @staticmethod
+    def _cache_path(key: str) -> Path:
+        return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _cached(self, key: str, ttl: float, producer: Callable[[], Any]) -> Any:
+        """Return the payload cached under key if younger than ttl, else store producer()'s result."""
+        cache_path = self._cache_path(key)
+        try:
+            with open(cache_path) as f:
+                entry = json.load(f)
+            if time.time() - entry['ts'] <= ttl:
+                return entry['payload']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        payload = producer()
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'payload': payload}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # caching is best effort
+        return payload
+
+    def _prs_cache_key(self, limit: int) -> str:
+        return f"prs:{self.repo}:@me:{limit}"
+
+    def invalidate_prs(self, limit: int = 50) -> None:
+        """Drop the cached PR list, e.g. after restarting jobs changed the CI state."""
+        self._cache_path(self._prs_cache_key(limit)).unlink(missing_ok=True)
+
     def get_user_prs(self, limit: int = 50) -> List[PRInfo]:
-        """Fetch user's PRs with CI status information."""
+        """Fetch user's PRs together with their CI checks and jobs."""
         print("Fetching your PRs with check status...")
 
         try:
-            result = subprocess.run([
-                'gh', 'pr', 'list', '--author', '@me', '--repo', self.repo,
-                '--limit', str(limit), '--json',
-                'number,title,author,headRefOid,statusCheckRollup'
-            ], capture_output=True, text=True, check=True)
-
-            pr_data = json.loads(result.stdout)
+            pr_data = self._cached(self._prs_cache_key(limit), CACHE_TTL, lambda: self._gql(PRS_QUERY, {
+                'search': f'repo:{self.repo} is:pr is:open author:@me',
+                'limit': limit,
+            }, PRS_JQ))
             return self._parse_pr_data(pr_data)
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
             print(f"Error fetching PRs: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -98,26 +245,16 @@ class GitHubClient:
         prs = []
 
         for pr in pr_data:
-            # Extract check states
-            states = []
-            for check in pr.get('statusCheckRollup', []):
-                if check.get('__typename') == 'CheckRun':
-                    states.append(check.get('conclusion', ''))
-                else:
-                    states.append(check.get('state', ''))
-
-            # Determine overall CI state
-            failed_states = {'FAILURE', 'ERROR', 'CANCELLED', 'TIMED_OUT',
-                             'failure', 'error', 'cancelled', 'timed_out'}
-            pending_states = {'PENDING', 'QUEUED', 'IN_PROGRESS', 'REQUESTED',
-                              'pending', 'queued', 'in_progress', 'requested'}
-
-            failed_count = sum(1 for state in states if state in failed_states)
-            pending_count = sum(1 for state in states if state in pending_states)
-
-            if any(state in failed_states for state in states):
+            # Count failed/pending checks in one pass
+            failed_count = 0
+            pending_count = 0
+            for state in pr['states']:
+                failed_count += state in FAILED_STATES
+                pending_count += state in PENDING_STATES
+
+            if failed_count:
                 ci_state = 'FAILURE'
-            elif any(state in pending_states for state in states):
+            elif pending_count:
                 ci_state = 'PENDING'
             else:
                 ci_state = 'SUCCESS'
@@ -125,78 +262,53 @@ class GitHubClient:
             prs.append(PRInfo(
                 number=pr['number'],
                 title=pr['title'],
-                author=pr['author']['login'],
+                author=pr['author'],
                 head_ref_oid=pr['headRefOid'],
                 ci_state=ci_state,
                 failed_count=failed_count,
-                pending_count=pending_count
+                pending_count=pending_count,
+                github_jobs=self._parse_workflow_runs(pr['runs']),
+                jenkins_jobs=self._parse_jenkins_jobs(pr['statuses'])
             ))
 
         return prs
 
-    def get_pr_sha(self, pr_number: int) -> Optional[str]:
-        """Get SHA for a specific PR."""
-        try:
-            result = subprocess.run([
-                'gh', 'pr', 'view', str(pr_number),
-                '--json', 'headRefOid', '-q', '.headRefOid'
-            ], capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return None
-
-    def get_workflow_runs(self, sha: str) -> List[JobInfo]:
+    @staticmethod
+    def _parse_workflow_runs(runs: List[Dict[str, Any]]) -> List[JobInfo]:
         """Get failed/pending GitHub Actions workflow runs."""
-        try:
-            result = subprocess.run([
-                'gh', 'run', 'list', '--repo', self.repo, '--commit', sha,
-                '--json', 'databaseId,name,conclusion,status,workflowName,createdAt'
-            ], capture_output=True, text=True, check=True)
-
-            runs_data = json.loads(result.stdout)
-            jobs = []
-
-            for run in runs_data:
-                if (run.get('conclusion') == 'failure' or
-                        run.get('status') in ['in_progress', 'queued', 'pending']):
-                    jobs.append(JobInfo(
-                        job_type='github',
-                        job_id=str(run['databaseId']),
-                        workflow_name=run['workflowName'],
-                        run_name=run['name'],
-                        conclusion=run.get('conclusion') or run.get('status'),
-                        created_at=run['createdAt']
-                    ))
-
-            return jobs
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            return []
+        jobs = []
 
-    def get_jenkins_jobs(self, sha: str) -> List[JobInfo]:
-        """Get failed Jenkins jobs from commit status."""
-        try:
-            result = subprocess.run([
-                'gh', 'api', f'repos/{self.repo}/commits/{sha}/status'
-            ], capture_output=True, text=True, check=True)
-
-            status_data = json.loads(result.stdout)
-            jobs = []
-
-            for status in status_data.get('statuses', []):
-                if (status.get('state') in ['failure', 'error'] and
-                        'job/github_trigger/job' not in status.get('target_url', '')):
-                    jobs.append(JobInfo(
-                        job_type='jenkins',
-                        job_id=status['target_url'],
-                        workflow_name=status['context'],
-                        run_name='Jenkins Job',
-                        conclusion=status['state'],
-                        created_at=status['updated_at']
-                    ))
-
-            return jobs
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            return []
+        for run in runs:
+            if run['conclusion'] == 'failure' or run['status'] in ['in_progress', 'queued', 'pending']:
+                jobs.append(JobInfo(
+                    job_type='github',
+                    job_id=str(run['databaseId']),
+                    workflow_name=run['workflowName'],
+                    run_name=f"#{run['runNumber']} ({run['event']})",
+                    conclusion=run['conclusion'] or run['status'],
+                    created_at=run['createdAt']
+                ))
+
+        return jobs
+
+    @staticmethod
+    def _parse_jenkins_jobs(statuses: List[Dict[str, Any]]) -> List[JobInfo]:
+        """Get failed Jenkins jobs from the commit statuses."""
+        jobs = []
+
+        for status in statuses:
+            target_url = status['targetUrl'] or ''
+            if status['state'] in ['failure', 'error'] and 'job/github_trigger/job' not in target_url:
+                jobs.append(JobInfo(
+                    job_type='jenkins',
+                    job_id=target_url,
+                    workflow_name=status['context'],
+                    run_name='Jenkins Job',
+                    conclusion=status['state'],
+                    created_at=status['createdAt']
+                ))
+
+        return jobs
 
     def restart_github_job(self, run_id: str) -> bool:
         """Restart a GitHub Actions workflow run."""
@@ -213,15 +325,21 @@ class JenkinsClient:
     """Handles Jenkins API interactions."""
 
     def __init__(self):
-        self.jenkins_url = self._get_jenkins_url()
         self.auth_file = Path.home() / '.authinfo'
-        self.tls_option = '-k'  # @todo: make configurable
+        self.jenkins_url = self._get_jenkins_url()
+        auth = self._get_credentials()
+        self._crumb: Optional[str] = None
+        self._crumb_lock = threading.Lock()
+        # One keep-alive session for all restarts of the run
+        self._sess = requests.Session()
+        self._sess.auth = auth
+        self._sess.verify = False  # @todo: make configurable
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     def _get_jenkins_url(self) -> Optional[str]:
         """Extract Jenkins URL from auth file."""
-        auth_file = Path.home() / '.authinfo'
         try:
-            with open(auth_file, 'r') as f:
+            with open(self.auth_file, 'r') as f:
                 for line in f:
                     parts = line.strip().split()
                     if len(parts) >= 2 and parts[0] == 'machine':
@@ -230,63 +348,76 @@ class JenkinsClient:
             pass
         return None
 
+    def _get_credentials(self) -> Optional[Tuple[str, str]]:
+        """Look up (login, password) for the Jenkins machine, as curl --netrc-file did."""
+        if not self.jenkins_url:
+            return None
+        try:
+            entry = netrc.netrc(self.auth_file).authenticators(self.jenkins_url)
+        except (OSError, netrc.NetrcParseError):
+            return None
+        if not entry:
+            return None
+        login, _, password = entry
+        return login, password
+
     def restart_jenkins_job(self, build_url: str) -> bool:
         """Restart a Jenkins job using rebuild API."""
         if not self.jenkins_url:
             return False
 
         try:
-            # Get CSRF crumb
-            crumb_url = f"{self.jenkins_url}/crumbIssuer/api/json"
-            crumb_result = subprocess.run([
-                'curl', '-s', self.tls_option, '--netrc-file', str(self.auth_file),
-                crumb_url
-            ], capture_output=True, text=True)
-
-            if crumb_result.returncode != 0:
-                return False
-
-            try:
-                crumb_data = json.loads(crumb_result.stdout)
-                crumb = crumb_data.get('crumb')
-            except json.JSONDecodeError:
-                return False
-
-            if not crumb:
+            # Get CSRF crumb, once per run. The crumb is bound to the session
+            # cookie, so concurrent restarts must not each request their own.
+            with self._crumb_lock:
+                if not self._crumb:
+                    crumb_url = f"{self.jenkins_url}/crumbIssuer/api/json"
+                    crumb_response = self._sess.get(crumb_url)
+                    if not crumb_response.ok:
+                        return False
+                    self._crumb = crumb_response.json().get('crumb')
+
+            if not self._crumb:
                 return False
 
             # Rebuild the job
             rebuild_url = f"{build_url.rstrip('/')}/rebuild?autorebuild=true"
-            rebuild_result = subprocess.run([
-                'curl', '-sS', '-L', self.tls_option, '--netrc-file', str(self.auth_file),
-                '-H', f'Jenkins-Crumb:{crumb}', '-X', 'POST', rebuild_url
-            ], capture_output=True)
+            rebuild_response = self._sess.post(rebuild_url, headers={'Jenkins-Crumb': self._crumb})
 
-            return rebuild_result.returncode == 0
-        except Exception:
+            return rebuild_response.ok
+        except (requests.RequestException, ValueError):
             return False
 
 
 class FzfInterface:
     """Handles fzf interactions for user selection."""
 
-    @staticmethod
-    def select_pr(prs: List[PRInfo]) -> Optional[PRInfo]:
+    # Icons are encoded once, the fzf input is assembled as bytes
+    PR_ICONS = {'FAILURE': '❌'.encode(), 'PENDING': '🟡'.encode(), 'SUCCESS': '✅'.encode()}
+    UNKNOWN_ICON = '❓'.encode()
+    PENDING_JOB_ICON = '🟡'.encode()
+    FAILED_JOB_ICON = '❌'.encode()
+    JOB_TYPE_ICONS = {'github': '🔧'.encode(), 'jenkins': '⚙️'.encode()}
+
+    @classmethod
+    def select_pr(cls, prs: List[PRInfo]) -> Optional[PRInfo]:
         """Let user select a PR using fzf."""
         if not prs:
             print("No PRs found.")
             return None
 
+        by_number = {pr.number: pr for pr in prs}
+
         # Format PR list for fzf
         pr_lines = []
         for pr in prs:
-            status_icon = {
-                'FAILURE': f'❌({pr.failed_count})',
-                'PENDING': f'🟡({pr.pending_count})',
-                'SUCCESS': '✅'
-            }.get(pr.ci_state, '❓')
+            status_icon = cls.PR_ICONS.get(pr.ci_state, cls.UNKNOWN_ICON)
+            if pr.ci_state == 'FAILURE':
+                status_icon += b'(%d)' % pr.failed_count
+            elif pr.ci_state == 'PENDING':
+                status_icon += b'(%d)' % pr.pending_count
 
-            line = f"#{pr.number} {status_icon} [@{pr.author}] {pr.title}"
+            line = b'#%d %b %b' % (pr.number, status_icon, f"[@{pr.author}] {pr.title}".encode())
             pr_lines.append(line)
 
         # Run fzf
@@ -296,70 +427,59 @@ class FzfInterface:
                 '--header=Select PR to restart checks (❌=failed, 🟡=pending, ✅=success)',
                 '--preview=echo {} | cut -d" " -f1 | sed "s/#//" | xargs -I{} gh pr view {} --json title,body,headRefOid -q "\\"Title: \\" + .title + \\"\\n\\nBody:\\n\\" + .body"',  # noqa: E501
                 '--preview-window=right:60%:wrap'
-            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
 
-            selected, _ = fzf_process.communicate('\n'.join(pr_lines))
+            selected, _ = fzf_process.communicate(b'\n'.join(pr_lines))
 
             if fzf_process.returncode != 0 or not selected.strip():
                 return None
 
             # Parse selected PR number
-            pr_number = int(selected.split()[0][1:])  # Remove # prefix
-            return next((pr for pr in prs if pr.number == pr_number), None)
+            pr_number = int(selected.partition(b' ')[0][1:])  # Remove # prefix
+            return by_number.get(pr_number)
 
         except (subprocess.CalledProcessError, ValueError):
             return None
 
-    @staticmethod
-    def select_jobs(jobs: List[JobInfo]) -> List[JobInfo]:
+    @classmethod
+    def select_jobs(cls, jobs: List[JobInfo]) -> List[JobInfo]:
         """Let user select jobs to restart using fzf."""
         if not jobs:
             print("No failed or pending jobs found.")
             return []
 
-        # Format job list for fzf
+        # Format job list for fzf, each line keyed by its hidden job index (lines may repeat)
         job_lines = []
         for i, job in enumerate(jobs):
-            status_icon = '🟡' if job.conclusion in ['in_progress', 'pending', 'queued'] else '❌'
-            type_icon = '🔧' if job.job_type == 'github' else '⚙️'
-
-            try:
-                created_date = datetime.fromisoformat(job.created_at.replace('Z', '+00:00'))
-                date_str = created_date.strftime('%m-%d %H:%M')
-            except (ValueError, AttributeError):
-                date_str = job.created_at
+            status_icon = (cls.PENDING_JOB_ICON if job.conclusion in ['in_progress', 'pending', 'queued']
+                           else cls.FAILED_JOB_ICON)
+            type_icon = cls.JOB_TYPE_ICONS['github' if job.job_type == 'github' else 'jenkins']
 
-            line = f"{job.job_type} {type_icon} {status_icon} {job.workflow_name:<25} {job.run_name} [{date_str}]"
-            job_lines.append((line, i))
+            date_str = _fmt_ts(job.created_at)
+            details = f"{job.workflow_name:<25} {job.run_name} [{date_str}]"
+            line = b'%d\t%b %b %b %b' % (i, job.job_type.encode(), type_icon, status_icon, details.encode())
+            job_lines.append(line)
 
         # Run fzf with multi-select
         try:
             fzf_process = subprocess.Popen([
                 'fzf', '-m', '--bind', 'ctrl-a:select-all',
+                '--delimiter', '\t', '--with-nth', '2..',
                 '--marker', '↻ ', '--color', 'marker:yellow',
                 '--header=Select jobs to restart (🔧=GitHub Actions, ⚙️=Jenkins, TAB: multi-select, Ctrl+A: select all)',
                 '--preview=echo "Job details preview"',  # @todo: implement proper preview
                 '--preview-window=right:50%:wrap'
-            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
 
-            selected, _ = fzf_process.communicate('\n'.join(line for line, _ in job_lines))
+            selected, _ = fzf_process.communicate(b'\n'.join(job_lines))
 
             if fzf_process.returncode != 0 or not selected.strip():
                 return []
 
-            # Match selected lines to jobs
-            selected_lines = selected.strip().split('\n')
-            selected_jobs = []
-
-            for selected_line in selected_lines:
-                for line, index in job_lines:
-                    if line == selected_line:
-                        selected_jobs.append(jobs[index])
-                        break
-
-            return selected_jobs
+            # Match selected lines to jobs through their index
+            return [jobs[int(line.partition(b'\t')[0])] for line in selected.strip().split(b'\n')]
 
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, ValueError, IndexError):
             return []
 
 
@@ -384,18 +504,9 @@ class RestartManager:
 
         print(f"Selected PR: {selected_pr.number}")
 
-        # Get SHA for selected PR
-        sha = self.github.get_pr_sha(selected_pr.number)
-        if not sha:
-            print(f"Error: Could not get SHA for PR {selected_pr.number}")
-            return
-
-        # Step 2: Get failed/pending jobs
-        print(f"Fetching GitHub Actions workflow runs for PR {selected_pr.number}...")
-        github_jobs = self.github.get_workflow_runs(sha)
-
-        print(f"Fetching Jenkins jobs for PR {selected_pr.number}...")
-        jenkins_jobs = self.github.get_jenkins_jobs(sha)
+        # Step 2: Get failed/pending jobs (already fetched along with the PR)
+        github_jobs = selected_pr.github_jobs
+        jenkins_jobs = selected_pr.jenkins_jobs
 
         all_jobs = github_jobs + jenkins_jobs
 
@@ -412,33 +523,45 @@ class RestartManager:
             return
 
         # Step 4: Restart selected jobs
-        print("Restarting selected jobs...")
-        success_count = 0
-        fail_count = 0
-
-        for job in selected_jobs:
-            print(f"↻ Restarting {job.job_type} job: {job.workflow_name}")
-
-            success = False
-            if job.job_type == 'github':
-                success = self.github.restart_github_job(job.job_id)
-            elif job.job_type == 'jenkins':
-                success = self.jenkins.restart_jenkins_job(job.job_id)
-
+        lines = ["Restarting selected jobs...\n"]
+        lines += [f"↻ Restarting {job.job_type} job: {job.workflow_name}\n" for job in selected_jobs]
+        sys.stdout.write(''.join(lines) + '\n')
+        sys.stdout.flush()
+
+        # The restarts are independent network calls, issue them all at once
+        with ThreadPoolExecutor(max_workers=RESTART_WORKERS) as executor:
+            futures = [executor.submit(self._restart_job, job) for job in selected_jobs]
+            results = [future.result() for future in futures]
+
+        success_count = sum(results)
+        fail_count = len(results) - success_count
+        if success_count:
+            self.github.invalidate_prs()
+
+        # Report in selection order with a single write
+        lines = []
+        for job, success in zip(selected_jobs, results):
             if success:
-                print(f"✅ Successfully restarted {job.job_type} job: {job.workflow_name}")
-                success_count += 1
+                lines.append(f"✅ Successfully restarted {job.job_type} job: {job.workflow_name}\n")
             else:
-                print(f"❌ Failed to restart {job.job_type} job: {job.workflow_name}")
-                fail_count += 1
-            print()
-
-        # Summary
-        print("Summary:")
-        print(f"✅ Successfully restarted: {success_count} jobs")
-        print(f"❌ Failed to restart: {fail_count} jobs")
-        print()
-        print("Check the Actions tab and Jenkins to monitor the restarted jobs.")
+                lines.append(f"❌ Failed to restart {job.job_type} job: {job.workflow_name}\n")
+        lines += [
+            "\n",
+            "Summary:\n",
+            f"✅ Successfully restarted: {success_count} jobs\n",
+            f"❌ Failed to restart: {fail_count} jobs\n",
+            "\n",
+            "Check the Actions tab and Jenkins to monitor the restarted jobs.\n",
+        ]
+        sys.stdout.write(''.join(lines))
+
+    def _restart_job(self, job: JobInfo) -> bool:
+        """Restart a single job with the client matching its type."""
+        if job.job_type == 'github':
+            return self.github.restart_github_job(job.job_id)
+        if job.job_type == 'jenkins':
+            return self.jenkins.restart_jenkins_job(job.job_id)
+        return False
 
 
 def main() -> None:
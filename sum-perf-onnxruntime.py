@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import json
+import ijson
 import pandas as pd
 import argparse
 
@@ -14,19 +14,23 @@ def parse_args():
 
 
 def get_dataframe(path):
-    with open(path) as f:
-        d = json.load(f)
-        return pd.json_normalize(d)
+    # stream the events one by one, the profile of a long run can take hundreds of MB
+    with open(path, 'rb') as f:
+        # pick only the used fields instead of flattening every event with json_normalize,
+        # keeping kernel events only (args.provider must be present)
+        rows = [(e['name'], e['dur'], e_args.get('op_name'))
+                for e in ijson.items(f, 'item', use_float=True)
+                if 'dur' in e and (e_args := e.get('args', {})).get('provider') is not None]
+    df = pd.DataFrame(rows, columns=['name', 'dur', 'args.op_name'])
+    # group on integer codes instead of hashing strings
+    return df.astype({'name': 'category', 'args.op_name': 'category'})
 
 
 def aggregate(df, group_by):
-    df = df[['name', 'dur', 'args.op_name', 'args.provider']]
-    # args.provider must be present
-    defined_kernel_time = df[df['args.provider'].notnull()]
     # group by all the inferences first
-    aggregated = defined_kernel_time.groupby(['name', 'args.op_name'])['dur'].mean().reset_index()
-    # group by requested group
-    aggregated = aggregated.groupby(group_by, as_index=False)['dur'].agg(['count', 'sum'])
+    means = df.groupby(['name', 'args.op_name'], observed=True)['dur'].mean()
+    # group by requested group, regrouping the index levels of the means
+    aggregated = means.groupby(level=group_by, observed=True).agg(['count', 'sum']).reset_index()
     # sort by duration
     result = aggregated.sort_values(by=['sum'], ascending=False)
     result = result.round({'sum': 3})
@@ -34,13 +38,12 @@ def aggregate(df, group_by):
     result.loc[:, 'sum'] /= 1000
     # add percentage
     result['%'] = (result['sum'] / result['sum'].sum()) * 100
-    # add total
-    result.loc['Total'] = result.sum(numeric_only=True)
-    result.at['Total', 'args.op_name'] = 'Total'
+    # add total, appended as a separate frame to keep the column dtypes (count stays int)
+    total = pd.DataFrame([{'args.op_name': 'Total', 'count': result['count'].sum(),
+                           'sum': result['sum'].sum(), '%': result['%'].sum()}])
+    result = pd.concat([result, total], ignore_index=True)
     # round percentage
     result = result.round({'%': 2})
-    # ensure count as int (no trailing .0)
-    result['count'] = result['count'].astype('int')
     # rename columns
     result = result.rename(columns={"args.op_name": "Node type", "count": "Count", "sum": "Sum (ms)"})
     return result